@@ -3,6 +3,8 @@ const path = require('path');
 const os = require('os');
 const { exec, execSync } = require('child_process');
 const { executeCommandSync, commandExistsOptimized } = require('./core');
+const { readJsonFile, writeFileAtomic } = require('./utils');
+const { prompt } = require('./prompt');
 
 /**
  * Advanced Authentication for gitAuto
@@ -11,11 +13,14 @@ const { executeCommandSync, commandExistsOptimized } = require('./core');
 
 // Configuration
 const CONFIG_FILE = path.join(os.homedir(), '.gitauto_config.json');
+// Manually entered tokens are kept here; GitHub CLI tokens stay in gh's own store
+const CREDENTIALS_FILE = path.join(os.homedir(), '.gitauto_credentials.json');
 
-// Cache for credentials
+// Credentials are resolved once and reused for the rest of the session,
+// so repeated operations don't re-spawn the GitHub CLI
 let credentialsCache = null;
-let cacheTimestamp = 0;
-const CACHE_TIMEOUT = 30000; // 30 seconds
+// Whether the cached credentials came from CREDENTIALS_FILE rather than gh
+let credentialsFromFile = false;
 
 /**
  * Load saved credentials
@@ -23,7 +28,7 @@ const CACHE_TIMEOUT = 30000; // 30 seconds
  */
 function loadCredentialsAdvanced() {
   // Check cache first
-  if (credentialsCache && (Date.now() - cacheTimestamp < CACHE_TIMEOUT)) {
+  if (credentialsCache) {
     return credentialsCache;
   }
   
@@ -40,20 +45,128 @@ function loadCredentialsAdvanced() {
         const username = usernameMatch ? usernameMatch[1] : 'unknown';
         
         const credentials = { username, token };
-        credentialsCache = credentials;
-        cacheTimestamp = Date.now();
+        cacheCredentials(credentials);
         return credentials;
       } catch (error) {
         // GitHub CLI not logged in or other error
       }
     }
     
+    // Fall back to a previously saved personal access token
+    const savedCredentials = readJsonFile(CREDENTIALS_FILE);
+    if (savedCredentials && savedCredentials.token) {
+      cacheCredentials(savedCredentials);
+      credentialsFromFile = true;
+      return savedCredentials;
+    }
+    
     return { username: null, token: null };
   } catch (error) {
     return { username: null, token: null };
   }
 }
 
+/**
+ * Keep credentials for the rest of the session
+ * @param {Object} credentials - Username and token
+ */
+function cacheCredentials(credentials) {
+  credentialsCache = credentials;
+  credentialsFromFile = false;
+}
+
+/**
+ * Save credentials for this and future sessions
+ * The file is replaced atomically and readable only by the current user
+ * @param {Object} credentials - Username and token
+ */
+function saveCredentials(credentials) {
+  cacheCredentials(credentials);
+  
+  try {
+    writeFileAtomic(CREDENTIALS_FILE, JSON.stringify(credentials));
+    credentialsFromFile = true;
+  } catch (error) {
+    console.error('❌ Error saving credentials:', error.message);
+  }
+}
+
+/**
+ * Clear cached credentials so the next load re-authenticates
+ */
+function clearCredentialsCache() {
+  credentialsCache = null;
+}
+
+/**
+ * Forget the saved personal access token, e.g. after GitHub rejects it
+ */
+function clearSavedCredentials() {
+  clearCredentialsCache();
+  
+  try {
+    fs.unlinkSync(CREDENTIALS_FILE);
+  } catch (error) {
+    if (error.code !== 'ENOENT') {
+      console.error('❌ Error removing saved credentials:', error.message);
+    }
+  }
+}
+
+/**
+ * Forget credentials that GitHub rejected
+ * The saved token file is only removed if the rejected token came from it,
+ * a GitHub CLI token is left for gh to manage
+ */
+function forgetRejectedCredentials() {
+  if (credentialsFromFile) {
+    clearSavedCredentials();
+  } else {
+    clearCredentialsCache();
+  }
+}
+
+/**
+ * Ask the user for a personal access token
+ * @returns {Promise<string>} Token, or an empty string if none was entered
+ */
+async function promptForToken() {
+  const answers = await prompt([
+    {
+      type: 'password',
+      name: 'token',
+      message: 'Enter your GitHub personal access token:',
+      mask: '*'
+    }
+  ]);
+  return (answers.token || '').trim();
+}
+
+/**
+ * Look up the GitHub username a token belongs to
+ * @param {string} token - Personal access token
+ * @returns {Promise<string|null>} Username, or null if GitHub rejects the token
+ */
+async function getUsernameFromToken(token) {
+  // Loaded here so startup doesn't pay for axios when gh handles login
+  const axios = require('axios');
+  
+  try {
+    const response = await axios.get('https://api.github.com/user', {
+      headers: {
+        'Authorization': `token ${token}`,
+        'User-Agent': 'gitauto-cli-advanced'
+      },
+      timeout: 10000 // 10 second timeout
+    });
+    return response.data && response.data.login ? response.data.login : null;
+  } catch (error) {
+    const status = error.response ? error.response.status : error.message;
+    console.error(`❌ Could not verify token: ${status}`);
+    return null;
+  }
+}
+
 /**
  * Advanced authentication using GitHub CLI with fallback options
  * @returns {Promise<Object>} Username and token
@@ -80,7 +193,6 @@ async function loginAdvanced() {
       const newCredentials = loadCredentialsAdvanced();
       if (newCredentials.token) {
         console.log(`✅ Successfully logged in as ${newCredentials.username}`);
-        saveCredentials(newCredentials);
         return newCredentials;
       }
     } catch (error) {
@@ -129,12 +241,9 @@ async function loginAdvanced() {
  * @returns {Object} Configuration object
  */
 function getConfig() {
-  try {
-    if (fs.existsSync(CONFIG_FILE)) {
-      return JSON.parse(fs.readFileSync(CONFIG_FILE, 'utf8'));
-    }
-  } catch (error) {
-    // Ignore errors
+  const config = readJsonFile(CONFIG_FILE);
+  if (config) {
+    return config;
   }
   
   // Return default configuration
@@ -166,6 +275,7 @@ function clearConfig() {
     if (fs.existsSync(CONFIG_FILE)) {
       fs.unlinkSync(CONFIG_FILE);
     }
+    clearSavedCredentials();
     console.log('🧹 Configuration cleared');
   } catch (error) {
     console.error('❌ Error clearing configuration:', error.message);
@@ -175,6 +285,11 @@ function clearConfig() {
 // At the bottom of the file, update the module.exports to match what menu.js expects
 module.exports = {
   loadCredentials: loadCredentialsAdvanced,
+  cacheCredentials,
+  saveCredentials,
+  clearCredentialsCache,
+  clearSavedCredentials,
+  forgetRejectedCredentials,
   loginAdvanced,
   getConfig,
   saveConfig,
@@ -1,6 +1,28 @@
 const { executeCommandAdvanced } = require('../core');
+const { refExistsAdvanced } = require('./object-lookup');
 const fs = require('fs');
 
+/**
+ * Check whether a branch exists locally or as a remote-tracking branch
+ * @param {string} branchName - Name of the branch
+ * @returns {Promise<boolean>} True if the branch can be checked out
+ */
+async function branchExists(branchName) {
+  if (await refExistsAdvanced(`refs/heads/${branchName}`)) {
+    return true;
+  }
+  
+  // Only list remotes when the branch isn't local
+  const remoteResult = await executeCommandAdvanced('git remote', { captureOutput: true });
+  if (!remoteResult.success) {
+    return false;
+  }
+  
+  const remotes = remoteResult.stdout.split('\n').map(r => r.trim()).filter(r => r.length > 0);
+  const matches = await Promise.all(remotes.map(remote => refExistsAdvanced(`refs/remotes/${remote}/${branchName}`)));
+  return matches.includes(true);
+}
+
 /**
  * Create and switch to a new branch with validation
  * @param {string} branchName - Name of the new branch
@@ -14,13 +36,9 @@ async function createBranchAdvanced(branchName) {
     }
     
     // Check if branch already exists
-    const branchResult = await executeCommandAdvanced('git branch');
-    if (branchResult.success && branchResult.stdout) {
-      const branches = branchResult.stdout.split('\n').map(b => b.trim().replace('*', '').trim());
-      if (branches.includes(branchName)) {
-        console.log(`⚠️ Branch '${branchName}' already exists`);
-        return { success: false, message: `Branch '${branchName}' already exists` };
-      }
+    if (await refExistsAdvanced(`refs/heads/${branchName}`)) {
+      console.log(`⚠️ Branch '${branchName}' already exists`);
+      return { success: false, message: `Branch '${branchName}' already exists` };
     }
     
     const result = await executeCommandAdvanced(`git checkout -b ${branchName}`);
@@ -90,14 +108,10 @@ async function switchBranchAdvanced(branchName) {
       return { success: true, message: `Already on branch '${branchName}'` };
     }
     
-    // Check if branch exists
-    const branchResult = await executeCommandAdvanced('git branch');
-    if (branchResult.success && branchResult.stdout) {
-      const branches = branchResult.stdout.split('\n').map(b => b.trim().replace('*', '').trim());
-      if (!branches.includes(branchName)) {
-        console.log(`❌ Branch '${branchName}' does not exist`);
-        return { success: false, message: `Branch '${branchName}' does not exist` };
-      }
+    // Check if branch exists locally, or on a remote for git checkout to track
+    if (!(await branchExists(branchName))) {
+      console.log(`❌ Branch '${branchName}' does not exist`);
+      return { success: false, message: `Branch '${branchName}' does not exist` };
     }
     
     const result = await executeCommandAdvanced(`git checkout ${branchName}`);
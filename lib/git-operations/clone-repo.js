@@ -1,18 +1,23 @@
 const { executeCommandAdvanced } = require('../core');
+const { execFileSync } = require('child_process');
 const fs = require('fs');
 const path = require('path');
 
 /**
  * Clone a repository with progress tracking
+ * Only the latest commit of the default branch is fetched unless full history is requested
  * @param {string} repoUrl - URL of the repository to clone
  * @param {string} dir - Directory to clone into (optional)
+ * @param {Object} options - Clone options
+ * @param {boolean} options.full - Fetch the complete history of every branch
  * @returns {Promise<Object>} Result object
  */
-async function cloneRepoAdvanced(repoUrl, dir = null) {
+async function cloneRepoAdvanced(repoUrl, dir = null, options = {}) {
   try {
     console.log(`📥 Cloning repository from ${repoUrl}...`);
     
-    const command = dir ? `git clone ${repoUrl} ${dir}` : `git clone ${repoUrl}`;
+    const cloneArgs = options.full ? repoUrl : `--depth=1 --single-branch ${repoUrl}`;
+    const command = dir ? `git clone ${cloneArgs} ${dir}` : `git clone ${cloneArgs}`;
     const result = await executeCommandAdvanced(command);
     
     if (result.success) {
@@ -55,6 +60,24 @@ async function autoCloneAndExitAdvanced(repoName, repoUrl) {
   }
 }
 
+/**
+ * Remove a directory tree
+ * On POSIX systems a single `rm -rf` walks the tree natively, which is much
+ * faster than fs.rmSync for .git folders holding thousands of loose objects
+ * @param {string} dirPath - Directory to remove
+ */
+function removeDirectory(dirPath) {
+  if (process.platform !== 'win32') {
+    try {
+      execFileSync('rm', ['-rf', '--', dirPath], { stdio: 'ignore' });
+      return;
+    } catch (error) {
+      // Fall back to Node's implementation if rm is unavailable or fails
+    }
+  }
+  fs.rmSync(dirPath, { recursive: true, force: true });
+}
+
 /**
  * Delete local repository folder with confirmation
  * @param {string} repoName - Name of the repository folder to delete
@@ -63,14 +86,27 @@ async function autoCloneAndExitAdvanced(repoName, repoUrl) {
 async function deleteLocalRepoAdvanced(repoName) {
   try {
     const repoPath = path.join(process.cwd(), repoName);
-    if (fs.existsSync(repoPath)) {
-      fs.rmSync(repoPath, { recursive: true, force: true });
-      console.log(`🗑️ Local folder '${repoName}' deleted!`);
-      return { success: true, message: `Local folder '${repoName}' deleted` };
-    } else {
+    
+    // One stat call answers both "does it exist" and "is it a folder"
+    let stats;
+    try {
+      stats = fs.statSync(repoPath);
+    } catch (error) {
+      if (error.code !== 'ENOENT') {
+        throw error;
+      }
       console.log(`ℹ️ Folder '${repoName}' does not exist`);
       return { success: true, message: `Folder '${repoName}' does not exist` };
     }
+    
+    if (!stats.isDirectory()) {
+      console.log(`❌ '${repoName}' is not a folder`);
+      return { success: false, message: `'${repoName}' is not a folder` };
+    }
+    
+    removeDirectory(repoPath);
+    console.log(`🗑️ Local folder '${repoName}' deleted!`);
+    return { success: true, message: `Local folder '${repoName}' deleted` };
   } catch (error) {
     console.error('❌ Error deleting local folder:', error.message);
     return { success: false, message: error.message };
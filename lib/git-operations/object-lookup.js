@@ -0,0 +1,135 @@
+const { spawn } = require('child_process');
+const path = require('path');
+
+// Long-running `git cat-file --batch-check` processes, one per repository
+const objectReaders = new Map();
+
+/**
+ * Keep the event loop alive only while a reader has queries in flight
+ * @param {Object} reader - Object reader
+ * @param {boolean} active - Whether queries are pending
+ */
+function setReaderActive(reader, active) {
+  if (active) {
+    reader.child.ref();
+    reader.child.stdout.ref();
+  } else {
+    reader.child.unref();
+    reader.child.stdout.unref();
+  }
+}
+
+/**
+ * Get (or start) the object reader for a repository
+ * @param {string} cwd - Repository directory
+ * @returns {Object} Reader with the child process and pending queries
+ */
+function getObjectReader(cwd) {
+  if (objectReaders.has(cwd)) {
+    return objectReaders.get(cwd);
+  }
+
+  const child = spawn('git', ['cat-file', '--batch-check'], {
+    cwd,
+    stdio: ['pipe', 'pipe', 'ignore']
+  });
+  const reader = { child, pending: [], buffer: '' };
+
+  child.stdout.setEncoding('utf8');
+  child.stdout.on('data', chunk => {
+    reader.buffer += chunk;
+
+    let newline;
+    while ((newline = reader.buffer.indexOf('\n')) !== -1) {
+      const line = reader.buffer.slice(0, newline);
+      reader.buffer = reader.buffer.slice(newline + 1);
+
+      const resolve = reader.pending.shift();
+      if (resolve) {
+        resolve(line);
+      }
+    }
+
+    // Let the CLI exit while the reader sits idle
+    if (reader.pending.length === 0) {
+      setReaderActive(reader, false);
+    }
+  });
+
+  // Fail any outstanding queries if git goes away
+  const shutdown = () => {
+    if (objectReaders.get(cwd) === reader) {
+      objectReaders.delete(cwd);
+    }
+    reader.pending.splice(0).forEach(resolve => resolve(null));
+  };
+  child.on('error', shutdown);
+  child.on('exit', shutdown);
+  child.stdin.on('error', shutdown);
+
+  child.stdin.unref();
+  setReaderActive(reader, false);
+
+  objectReaders.set(cwd, reader);
+  return reader;
+}
+
+/**
+ * Look up an object through the persistent reader instead of spawning git per query
+ * @param {string} spec - Object name, e.g. a SHA, "HEAD" or "refs/heads/main"
+ * @param {Object} options - Lookup options
+ * @param {string} options.cwd - Repository directory (defaults to the current directory)
+ * @returns {Promise<Object|null>} Object info ({ sha, type, size }) or null if missing
+ */
+async function queryObjectAdvanced(spec, options = {}) {
+  if (!spec || /[\r\n]/.test(spec)) {
+    return null;
+  }
+
+  const cwd = path.resolve(options.cwd || process.cwd());
+  const reader = getObjectReader(cwd);
+
+  const line = await new Promise(resolve => {
+    reader.pending.push(resolve);
+    setReaderActive(reader, true);
+    reader.child.stdin.write(`${spec}\n`);
+  });
+
+  // Missing objects come back as "<spec> missing" (or "ambiguous")
+  const parts = line ? line.split(' ') : [];
+  if (parts.length !== 3 || parts[2] === 'missing') {
+    return null;
+  }
+
+  return {
+    sha: parts[0],
+    type: parts[1],
+    size: parseInt(parts[2], 10)
+  };
+}
+
+/**
+ * Check whether a ref resolves to an object
+ * @param {string} ref - Ref name, e.g. "refs/heads/main"
+ * @param {Object} options - Lookup options (see queryObjectAdvanced)
+ * @returns {Promise<boolean>} True if the ref exists
+ */
+async function refExistsAdvanced(ref, options = {}) {
+  return (await queryObjectAdvanced(ref, options)) !== null;
+}
+
+/**
+ * Stop all running object readers
+ */
+function closeObjectReaders() {
+  for (const reader of objectReaders.values()) {
+    reader.child.stdin.end();
+  }
+  objectReaders.clear();
+}
+
+module.exports = {
+  queryObjectAdvanced,
+  refExistsAdvanced,
+  closeObjectReaders
+};
@@ -1,12 +1,13 @@
-const { executeCommandAdvanced } = require('../core');
+const { executeCommandAdvanced, executeCommandsBatch } = require('../core');
 const fs = require('fs');
-const inquirer = require('inquirer');
+const { prompt } = require('../prompt');
 
 /**
  * Push changes to remote repository with comprehensive error handling
  * Implements automatic conflict resolution for non-fast-forward push rejections
  * @param {string} message - Commit message
  * @param {Object} options - Additional options
+ * @param {boolean} options.skipStatusCheck - Skip change detection when the caller already did it
  * @returns {Promise<Object>} Result object
  */
 async function pushRepoAdvanced(message = 'Auto commit', options = {}) {
@@ -24,8 +25,53 @@ async function pushRepoAdvanced(message = 'Auto commit', options = {}) {
     
     console.log('🔄 Preparing to push changes...');
     
-    // Add all changes (excluding node_modules which should be in .gitignore)
-    const addResult = await executeCommandAdvanced('git add .');
+    // Check if there are changes to commit
+    if (!options.skipStatusCheck) {
+      const statusResult = await executeCommandAdvanced('git status --porcelain', { silent: true });
+      if (!statusResult.success || !statusResult.stdout || statusResult.stdout.length === 0) {
+        console.log('ℹ️ No changes to commit');
+        console.log('\n💡 Suggestion: Make some changes to your files before committing');
+        console.log('\n📝 How to make changes:');
+        console.log('1. Edit existing files in your project');
+        console.log('2. Create new files: touch newfile.txt');
+        console.log('3. After changes, run git status to see them');
+        return { success: true, message: 'No changes to commit' };
+      }
+    }
+    
+    // Add and commit in a single subprocess; the push runs on its own below,
+    // so a local failure never contacts the remote twice
+    const batchResult = await executeCommandsBatch([
+      'git add .',
+      `git commit -m "${message}"`
+    ], { captureOutput: true });
+    
+    let addResult = { success: true, stdout: '', stderr: '' };
+    let commitResult = { success: true, stdout: batchResult.stdout, stderr: '' };
+    
+    // Show git's own summary (or hook output) that was captured with the batch
+    if (batchResult.stdout) {
+      process.stdout.write(batchResult.stdout);
+    }
+    
+    if (!batchResult.success) {
+      // Work out which step failed from the batch itself; re-running the commit
+      // would run its hooks (and stage any files they rewrote) a second time
+      const batchOutput = `${batchResult.stdout}${batchResult.stderr}`;
+      const stagedResult = await executeCommandAdvanced('git diff --cached --quiet', { silent: true });
+      const failedResult = { success: false, stdout: batchResult.stdout, stderr: batchResult.stderr };
+      
+      if (batchOutput.includes('nothing to commit')) {
+        commitResult = { success: true, skipped: true, stdout: '', stderr: '' };
+      } else if (stagedResult.success) {
+        // Nothing staged, so git add failed and the commit never ran
+        addResult = failedResult;
+        commitResult = null;
+      } else {
+        commitResult = failedResult;
+      }
+    }
+    
     if (!addResult.success) {
       console.log('⚠️ Warning: Failed to add changes');
       
@@ -155,7 +201,7 @@ async function pushRepoAdvanced(message = 'Auto commit', options = {}) {
       console.log('4. If no changes exist, there\'s nothing to commit');
       
       // Ask user if they want to continue
-      const answers = await inquirer.prompt([
+      const answers = await prompt([
         {
           type: 'confirm',
           name: 'continue',
@@ -170,20 +216,10 @@ async function pushRepoAdvanced(message = 'Auto commit', options = {}) {
       }
     }
     
-    // Check if there are changes to commit
-    const statusResult = await executeCommandAdvanced('git status --porcelain', { silent: true });
-    if (!statusResult.success || !statusResult.stdout || statusResult.stdout.length === 0) {
-      console.log('ℹ️ No changes to commit');
-      console.log('\n💡 Suggestion: Make some changes to your files before committing');
-      console.log('\n📝 How to make changes:');
-      console.log('1. Edit existing files in your project');
-      console.log('2. Create new files: touch newfile.txt');
-      console.log('3. After changes, run git status to see them');
-      return { success: true, message: 'No changes to commit' };
+    // Commit on its own only if the user chose to continue past a failed add
+    if (!commitResult) {
+      commitResult = await executeCommandAdvanced(`git commit -m "${message}"`);
     }
-    
-    // Commit changes
-    const commitResult = await executeCommandAdvanced(`git commit -m "${message}"`);
     if (!commitResult.success) {
       console.log('⚠️ Warning: Failed to commit changes');
       
@@ -328,7 +364,7 @@ async function pushRepoAdvanced(message = 'Auto commit', options = {}) {
       console.log('5. Check Git configuration with "git config --list"');
       
       // Ask user if they want to continue
-      const answers = await inquirer.prompt([
+      const answers = await prompt([
         {
           type: 'confirm',
           name: 'continue',
@@ -341,7 +377,7 @@ async function pushRepoAdvanced(message = 'Auto commit', options = {}) {
         console.log('❌ Push cancelled by user');
         return { success: false, message: 'Push cancelled by user' };
       }
-    } else {
+    } else if (!commitResult.skipped) {
       console.log('✅ Changes committed successfully!');
     }
     
@@ -372,7 +408,7 @@ async function pushRepoAdvanced(message = 'Auto commit', options = {}) {
           console.log('💡 Suggestion: Your local branch is behind the remote branch');
           
           // Ask user if they want to automatically resolve the non-fast-forward rejection
-          const answers = await inquirer.prompt([
+          const answers = await prompt([
             {
               type: 'confirm',
               name: 'autoResolve',
@@ -402,7 +438,7 @@ async function pushRepoAdvanced(message = 'Auto commit', options = {}) {
                 console.log('❌ Still unable to push changes after pulling');
                 
                 // If push still fails, offer to force push (with warning)
-                const forceAnswers = await inquirer.prompt([
+                const forceAnswers = await prompt([
                   {
                     type: 'confirm',
                     name: 'forcePush',
@@ -11,6 +11,7 @@ const { pullRepoAdvanced } = require('./git-operations/pull');
 const { createBranchAdvanced, listBranchesAdvanced, switchBranchAdvanced } = require('./git-operations/branch');
 const { showStatusAdvanced, showCommitHistoryAdvanced } = require('./git-operations/status-history');
 const { addFilesAdvanced, commitChangesAdvanced } = require('./git-operations/add-commit');
+const { queryObjectAdvanced, refExistsAdvanced, closeObjectReaders } = require('./git-operations/object-lookup');
 
 /**
  * Advanced Git Operations for gitAuto
@@ -45,5 +46,8 @@ module.exports = {
   deleteLocalRepoAdvanced,
   addFilesAdvanced,
   commitChangesAdvanced,
+  queryObjectAdvanced,
+  refExistsAdvanced,
+  closeObjectReaders,
   clearGitCache
 };
\ No newline at end of file
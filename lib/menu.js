@@ -1,11 +1,12 @@
-const inquirer = require('inquirer');
 const fs = require('fs');
 const path = require('path');
 const { 
   loadCredentials 
 } = require('./auth');
+const { prompt, isScripted } = require('./prompt');
 const { 
   createRepo, 
+  createRepos, 
   deleteRepo, 
   setRepoVisibility, 
   getAuthCloneUrl 
@@ -119,7 +120,7 @@ async function handleBatchRepos() {
   console.log('\n🔄 Batch Repository Operations');
   console.log('============================');
   
-  const answers = await inquirer.prompt([
+  const answers = await prompt([
     {
       type: 'input',
       name: 'repoPaths',
@@ -182,7 +183,7 @@ async function handleBatchRepos() {
  * Show main menu for users not in a git repository
  */
 async function showNonRepoMenuAdvanced() {
-  const answers = await inquirer.prompt([
+  const answers = await prompt([
     {
       type: 'list',
       name: 'action',
@@ -193,11 +194,12 @@ async function showNonRepoMenuAdvanced() {
         { name: '3️⃣ Batch Repository Operations', value: 'batch' },
         { name: '4️⃣ Performance Monitoring', value: 'performance' },
         { name: '5️⃣ Clone Public Repository', value: 'clone_public' },
-        { name: '🔟 Clear Caches', value: 'clear_cache' },
-        { name: '6️⃣ Exit', value: 'exit' }
+        { name: '6️⃣ Bulk Create Repositories', value: 'bulk_create' },
+        { name: '7️⃣ Clear Caches', value: 'clear_cache' },
+        { name: '8️⃣ Exit', value: 'exit' }
       ]
     }
-  ]);
+  ], { mainMenu: true });
   
   switch (answers.action) {
     case 'create':
@@ -215,6 +217,9 @@ async function showNonRepoMenuAdvanced() {
     case 'clone_public':
       await handleClonePublicRepo();
       break;
+    case 'bulk_create':
+      await handleBulkCreateRepos();
+      break;
     case 'clear_cache':
       clearCaches();
       clearAnalyticsCache(); // Clear our new analytics cache too
@@ -223,7 +228,7 @@ async function showNonRepoMenuAdvanced() {
       break;
     case 'exit':
       console.log('👋 Exiting...!');
-      process.exit(0);
+      process.exit();
   }
 }
 
@@ -231,7 +236,7 @@ async function showNonRepoMenuAdvanced() {
  * Show main menu for users in a git repository
  */
 async function showRepoMenuAdvanced() {
-  const answers = await inquirer.prompt([
+  const answers = await prompt([
     {
       type: 'list',
       name: 'action',
@@ -249,7 +254,7 @@ async function showRepoMenuAdvanced() {
         { name: '6️⃣ Exit', value: 'exit' }
       ]
     }
-  ]);
+  ], { mainMenu: true });
   
   switch (answers.action) {
     case 'analytics':
@@ -284,7 +289,7 @@ async function showRepoMenuAdvanced() {
       break;
     case 'exit':
       console.log('👋 Exiting...!');
-      process.exit(0);
+      process.exit();
   }
 }
 
@@ -292,7 +297,7 @@ async function showRepoMenuAdvanced() {
  * Show branch management submenu
  */
 async function showBranchMenu() {
-  const answers = await inquirer.prompt([
+  const answers = await prompt([
     {
       type: 'list',
       name: 'action',
@@ -308,7 +313,7 @@ async function showBranchMenu() {
   
   switch (answers.action) {
     case 'create':
-      const createAnswers = await inquirer.prompt([
+      const createAnswers = await prompt([
         {
           type: 'input',
           name: 'branchName',
@@ -321,7 +326,7 @@ async function showBranchMenu() {
       await listBranchesAdvanced();
       break;
     case 'switch':
-      const switchAnswers = await inquirer.prompt([
+      const switchAnswers = await prompt([
         {
           type: 'input',
           name: 'branchName',
@@ -339,7 +344,7 @@ async function showBranchMenu() {
  * Handle repository creation
  */
 async function handleCreateRepo() {
-  const answers = await inquirer.prompt([
+  const answers = await prompt([
     {
       type: 'input',
       name: 'repoName',
@@ -353,11 +358,13 @@ async function handleCreateRepo() {
     }
   ]);
   
-  const success = await createRepo(answers.repoName, answers.isPrivate);
+  // Load credentials once and share them between creation and cloning
+  const credentials = loadCredentials();
+  const success = await createRepo(answers.repoName, answers.isPrivate, { credentials });
   if (success) {
     // Auto-clone the newly created repository
     try {
-      const repoUrl = getAuthCloneUrl(answers.repoName);
+      const repoUrl = getAuthCloneUrl(answers.repoName, credentials);
       autoCloneAndExitAdvanced(answers.repoName, repoUrl);
     } catch (error) {
       console.error('❌ Auto-clone failed after repository creation');
@@ -365,15 +372,64 @@ async function handleCreateRepo() {
   }
 }
 
+/**
+ * Handle creating several repositories from a file of names
+ */
+async function handleBulkCreateRepos() {
+  console.log('\n📦 Bulk Repository Creation');
+  console.log('==========================');
+  
+  const answers = await prompt([
+    {
+      type: 'input',
+      name: 'filePath',
+      message: 'Enter path to a file with one repository name per line:'
+    },
+    {
+      type: 'confirm',
+      name: 'isPrivate',
+      message: 'Private repos?',
+      default: true
+    }
+  ]);
+  
+  let repoNames;
+  try {
+    const content = fs.readFileSync(answers.filePath, 'utf8');
+    repoNames = [...new Set(content.split(/\r?\n/).map(name => name.trim()).filter(name => name.length > 0))];
+  } catch (error) {
+    console.error('❌ Could not read file:', error.message);
+    return;
+  }
+  
+  if (repoNames.length === 0) {
+    console.log('❌ No repository names found in file!');
+    return;
+  }
+  
+  console.log(`\n🔄 Creating ${repoNames.length} repositories...`);
+  
+  const results = await createRepos(repoNames, answers.isPrivate);
+  const successCount = results.filter(result => result.success).length;
+  
+  console.log(`\n📈 Summary: ${successCount} created, ${results.length - successCount} failed`);
+}
+
 /**
  * Handle public repository cloning
  */
 async function handleClonePublicRepo() {
-  const answers = await inquirer.prompt([
+  const answers = await prompt([
     {
       type: 'input',
       name: 'repoUrl',
       message: 'Enter public Git repository URL:'
+    },
+    {
+      type: 'confirm',
+      name: 'fullHistory',
+      message: 'Clone full history? (slower for large repositories)',
+      default: false
     }
   ]);
   
@@ -384,7 +440,7 @@ async function handleClonePublicRepo() {
   
   try {
     const repoName = answers.repoUrl.split('/').pop().replace('.git', '');
-    await cloneRepoAdvanced(answers.repoUrl, repoName);
+    await cloneRepoAdvanced(answers.repoUrl, repoName, { full: answers.fullHistory });
     
     const repoPath = path.join(process.cwd(), repoName);
     if (fs.existsSync(repoPath)) {
@@ -411,7 +467,7 @@ async function handlePushRepo() {
       return;
     }
     
-    // Check status using executeCommandAdvanced from core
+    // A single porcelain status both detects and lists the pending changes
     const statusResult = await executeCommandAdvanced('git status --porcelain', { silent: true });
     if (!statusResult.success || !statusResult.stdout || statusResult.stdout.length === 0) {
       console.log('ℹ️ No changes to commit');
@@ -420,10 +476,10 @@ async function handlePushRepo() {
     
     // Show what will be committed
     console.log('Changes to be committed:');
-    await executeCommandAdvanced('git status --short');
+    console.log(statusResult.stdout.trimEnd());
     
     // Ask for confirmation or use default message
-    const answers = await inquirer.prompt([
+    const answers = await prompt([
       {
         type: 'input',
         name: 'message',
@@ -439,7 +495,8 @@ async function handlePushRepo() {
     ]);
     
     if (answers.confirm) {
-      await pushRepoAdvanced(answers.message);
+      // Changes were already detected above, so skip the second status probe
+      await pushRepoAdvanced(answers.message, { skipStatusCheck: true });
     } else {
       console.log('❌ Push cancelled');
     }
@@ -466,10 +523,8 @@ async function showMainMenuAdvanced() {
   if (inGitRepo) {
     const suggestions = await getSmartSuggestions();
     if (suggestions.length > 0) {
-      console.log('\n💡 Smart Suggestions:');
-      suggestions.forEach((suggestion, index) => {
-        console.log(`  ${index + 1}. ${suggestion.message}`);
-      });
+      const lines = suggestions.map((suggestion, index) => `  ${index + 1}. ${suggestion.message}`);
+      console.log(`\n💡 Smart Suggestions:\n${lines.join('\n')}`);
     }
   }
   
@@ -481,8 +536,10 @@ async function showMainMenuAdvanced() {
         await showNonRepoMenuAdvanced();
       }
       
-      // Small delay to allow reading output
-      await new Promise(resolve => setTimeout(resolve, 1000));
+      // Small delay to allow reading output (nobody is reading in scripted mode)
+      if (!isScripted()) {
+        await new Promise(resolve => setTimeout(resolve, 1000));
+      }
     } catch (error) {
       console.error('❌ An error occurred:', error.message);
     }
@@ -0,0 +1,117 @@
+const inquirer = require('inquirer');
+const fs = require('fs');
+
+/**
+ * Prompts for gitAuto
+ * Uses inquirer in a terminal and reads answers from stdin when scripted
+ */
+
+// Answers read from stdin in one go when scripted (pipes, CI)
+let scriptedAnswers = null;
+
+/**
+ * Check whether prompts are driven by a script rather than a user
+ * Both stdin and stdout must be redirected, since terminals such as mintty
+ * can report a pipe for stdin; GITAUTO_SCRIPTED=1 opts in explicitly
+ * @returns {boolean} True if answers should be read from stdin
+ */
+function isScripted() {
+  return process.env.GITAUTO_SCRIPTED === '1' || (!process.stdin.isTTY && !process.stdout.isTTY);
+}
+
+/**
+ * Get the next scripted answer, reading all of stdin on first use
+ * Running out of input is only a clean exit at the main menu; anywhere else
+ * the script stopped early, so exit non-zero
+ * @param {boolean} mainMenu - Whether the waiting prompt is the main menu
+ * @returns {string} Next input line
+ */
+function nextScriptedAnswer(mainMenu) {
+  if (scriptedAnswers === null) {
+    let input = '';
+    try {
+      input = fs.readFileSync(0, 'utf8');
+    } catch (error) {
+      // No readable input, treat as empty
+    }
+    scriptedAnswers = input.split(/\r?\n/);
+    if (scriptedAnswers[scriptedAnswers.length - 1] === '') {
+      scriptedAnswers.pop();
+    }
+  }
+  
+  if (scriptedAnswers.length === 0) {
+    if (mainMenu) {
+      console.log('👋 End of input, exiting...');
+      // Keeps the failure status of any earlier invalid answer
+      process.exit();
+    }
+    console.error('❌ End of input while waiting for an answer');
+    process.exit(1);
+  }
+  
+  return scriptedAnswers.shift().trim();
+}
+
+/**
+ * Turn a scripted input line into an answer for a question
+ * @param {Object} question - Inquirer question
+ * @param {string} line - Input line
+ * @returns {*} Answer value, or undefined if the line matches no option
+ */
+function parseScriptedAnswer(question, line) {
+  if (line === '' && question.default !== undefined) {
+    return question.default;
+  }
+  
+  switch (question.type) {
+    case 'confirm':
+      return /^y(es)?$/i.test(line);
+    case 'list': {
+      // Accept the option value or its full label
+      const choice = question.choices.find(c => c.value === line || c.name === line);
+      return choice ? choice.value : undefined;
+    }
+    default:
+      return line;
+  }
+}
+
+/**
+ * Ask questions interactively, or answer them from piped stdin
+ * In scripted mode each prompt is written with a single write call
+ * @param {Array} questions - Inquirer questions
+ * @param {Object} options - Prompt options
+ * @param {boolean} options.mainMenu - End of input here is a normal exit
+ * @returns {Promise<Object>} Answers keyed by question name
+ */
+async function prompt(questions, options = {}) {
+  if (!isScripted()) {
+    return inquirer.prompt(questions);
+  }
+  
+  const answers = {};
+  for (const question of questions) {
+    let text = `? ${question.message}\n`;
+    if (question.type === 'list') {
+      // Labels already carry their own numbers, so show the value to type instead
+      text += question.choices.map(choice => `  ${choice.name} (${choice.value})\n`).join('');
+    }
+    process.stdout.write(text);
+    
+    let answer = parseScriptedAnswer(question, nextScriptedAnswer(options.mainMenu));
+    while (answer === undefined) {
+      console.log('❌ Invalid option, please choose one of the listed values');
+      // A script that gave a bad answer must not end as a success
+      process.exitCode = 1;
+      answer = parseScriptedAnswer(question, nextScriptedAnswer(options.mainMenu));
+    }
+    answers[question.name] = answer;
+  }
+  return answers;
+}
+
+module.exports = {
+  isScripted,
+  prompt
+};
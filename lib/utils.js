@@ -1,4 +1,6 @@
 
+const fs = require('fs');
+
 /**
  * Converts a string to a URL-friendly slug.
  * @param {string} text The input string.
@@ -16,6 +18,47 @@ function slugify(text) {
     .replace(/--+/g, '-');
 }
 
+/**
+ * Read and parse a JSON file with a single read.
+ * @param {string} filePath The file to read.
+ * @param {*} fallback Value returned when the file is missing or invalid.
+ * @returns {*} The parsed contents, or the fallback.
+ */
+function readJsonFile(filePath, fallback = null) {
+  try {
+    return JSON.parse(fs.readFileSync(filePath, 'utf8'));
+  } catch (error) {
+    return fallback;
+  }
+}
+
+/**
+ * Write a file atomically with restricted permissions.
+ * The data goes to a temporary file that is renamed over the target, so an
+ * interrupted write never leaves a truncated file behind.
+ * @param {string} filePath The file to write.
+ * @param {string} data The file contents.
+ * @param {number} mode The file permissions (owner read/write by default).
+ */
+function writeFileAtomic(filePath, data, mode = 0o600) {
+  const tmpPath = `${filePath}.${process.pid}.tmp`;
+  try {
+    fs.writeFileSync(tmpPath, data, { encoding: 'utf8', mode });
+    // mode only applies to newly created files, so enforce it explicitly
+    fs.chmodSync(tmpPath, mode);
+    fs.renameSync(tmpPath, filePath);
+  } catch (error) {
+    try {
+      fs.unlinkSync(tmpPath);
+    } catch (unlinkError) {
+      // Ignore errors, the temporary file may not exist
+    }
+    throw error;
+  }
+}
+
 module.exports = {
   slugify,
+  readJsonFile,
+  writeFileAtomic,
 };
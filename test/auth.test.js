@@ -0,0 +1,68 @@
+const assert = require('assert');
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const core = require('../lib/core');
+
+describe('Auth Functions', function() {
+  let auth;
+  let tmpHome;
+  let originalHome;
+  let originalUserProfile;
+  let originalCommandExists;
+
+  // Load a fresh copy of the module with HOME in a temp dir and the GitHub CLI
+  // hidden, so the tests never read real credentials or run gh
+  before(function() {
+    tmpHome = fs.mkdtempSync(path.join(os.tmpdir(), 'gitauto-home-'));
+    originalHome = process.env.HOME;
+    originalUserProfile = process.env.USERPROFILE;
+    process.env.HOME = tmpHome;
+    process.env.USERPROFILE = tmpHome;
+
+    originalCommandExists = core.commandExistsOptimized;
+    core.commandExistsOptimized = () => false;
+
+    delete require.cache[require.resolve('../lib/auth')];
+    auth = require('../lib/auth');
+  });
+
+  after(function() {
+    delete require.cache[require.resolve('../lib/auth')];
+    core.commandExistsOptimized = originalCommandExists;
+
+    if (originalHome === undefined) {
+      delete process.env.HOME;
+    } else {
+      process.env.HOME = originalHome;
+    }
+    if (originalUserProfile === undefined) {
+      delete process.env.USERPROFILE;
+    } else {
+      process.env.USERPROFILE = originalUserProfile;
+    }
+
+    fs.rmSync(tmpHome, { recursive: true, force: true });
+  });
+
+  afterEach(function() {
+    auth.clearCredentialsCache();
+  });
+
+  describe('credentials cache', function() {
+    it('should return cached credentials without re-authenticating', function() {
+      const credentials = { username: 'octocat', token: 'test-token' };
+      auth.cacheCredentials(credentials);
+
+      assert.strictEqual(auth.loadCredentials(), credentials);
+      assert.strictEqual(auth.loadCredentials(), credentials);
+    });
+
+    it('should forget credentials once the cache is cleared', function() {
+      auth.cacheCredentials({ username: 'octocat', token: 'test-token' });
+      auth.clearCredentialsCache();
+
+      assert.deepStrictEqual(auth.loadCredentials(), { username: null, token: null });
+    });
+  });
+});
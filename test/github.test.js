@@ -0,0 +1,52 @@
+const assert = require('assert');
+const { isValidRepoName, createRepos } = require('../lib/github');
+const { cacheCredentials, clearCredentialsCache } = require('../lib/auth');
+
+describe('GitHub Functions', function() {
+  describe('isValidRepoName', function() {
+    it('should accept letters, digits, dots, underscores and hyphens', function() {
+      assert.strictEqual(isValidRepoName('my-repo_1.0'), true);
+    });
+
+    it('should reject empty names', function() {
+      assert.strictEqual(isValidRepoName(''), false);
+    });
+
+    it('should reject names starting with a hyphen', function() {
+      assert.strictEqual(isValidRepoName('-repo'), false);
+    });
+
+    it('should reject names with other characters', function() {
+      assert.strictEqual(isValidRepoName('my repo'), false);
+      assert.strictEqual(isValidRepoName('repo/name'), false);
+    });
+
+    it('should reject names longer than 100 characters', function() {
+      assert.strictEqual(isValidRepoName('a'.repeat(100)), true);
+      assert.strictEqual(isValidRepoName('a'.repeat(101)), false);
+    });
+  });
+
+  describe('createRepos', function() {
+    // Cached credentials keep these tests from running gh or reading the real home directory
+    beforeEach(function() {
+      cacheCredentials({ username: 'octocat', token: 'test-token' });
+    });
+
+    afterEach(function() {
+      clearCredentialsCache();
+    });
+
+    it('should return an empty array for no names', async function() {
+      assert.deepStrictEqual(await createRepos([]), []);
+    });
+
+    it('should report invalid names as failures in input order', async function() {
+      const results = await createRepos(['bad name', '-leading-hyphen']);
+      assert.deepStrictEqual(results, [
+        { repoName: 'bad name', success: false },
+        { repoName: '-leading-hyphen', success: false }
+      ]);
+    });
+  });
+});
@@ -0,0 +1,42 @@
+const assert = require('assert');
+const {
+  queryObjectAdvanced,
+  refExistsAdvanced,
+  closeObjectReaders
+} = require('../lib/git-operations/object-lookup');
+
+describe('Object Lookup', function() {
+  this.timeout(5000);
+
+  after(function() {
+    closeObjectReaders();
+  });
+
+  describe('queryObjectAdvanced', function() {
+    it('should resolve HEAD to a commit', async function() {
+      const info = await queryObjectAdvanced('HEAD');
+      assert.strictEqual(info.type, 'commit');
+      assert.strictEqual(info.sha.length, 40);
+    });
+
+    it('should answer concurrent queries in order', async function() {
+      const results = await Promise.all([
+        queryObjectAdvanced('HEAD'),
+        queryObjectAdvanced('refs/heads/nonexistent-branch-12345'),
+        queryObjectAdvanced('HEAD')
+      ]);
+      assert.strictEqual(results[0].sha, results[2].sha);
+      assert.strictEqual(results[1], null);
+    });
+
+    it('should reject object names containing newlines', async function() {
+      assert.strictEqual(await queryObjectAdvanced('HEAD\nHEAD'), null);
+    });
+  });
+
+  describe('refExistsAdvanced', function() {
+    it('should return false for missing refs', async function() {
+      assert.strictEqual(await refExistsAdvanced('refs/heads/nonexistent-branch-12345'), false);
+    });
+  });
+});
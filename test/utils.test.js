@@ -0,0 +1,58 @@
+const assert = require('assert');
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { readJsonFile, writeFileAtomic } = require('../lib/utils');
+
+describe('Utility Functions', function() {
+  let tmpDir;
+
+  beforeEach(function() {
+    tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), 'gitauto-'));
+  });
+
+  afterEach(function() {
+    fs.rmSync(tmpDir, { recursive: true, force: true });
+  });
+
+  describe('readJsonFile', function() {
+    it('should parse an existing file', function() {
+      const filePath = path.join(tmpDir, 'data.json');
+      fs.writeFileSync(filePath, '{"token":"abc"}');
+
+      assert.deepStrictEqual(readJsonFile(filePath), { token: 'abc' });
+    });
+
+    it('should return the fallback for missing or invalid files', function() {
+      const filePath = path.join(tmpDir, 'data.json');
+      assert.deepStrictEqual(readJsonFile(filePath, {}), {});
+
+      fs.writeFileSync(filePath, 'not json');
+      assert.strictEqual(readJsonFile(filePath), null);
+    });
+  });
+
+  describe('writeFileAtomic', function() {
+    it('should replace the file contents', function() {
+      const filePath = path.join(tmpDir, 'data.json');
+      fs.writeFileSync(filePath, 'old');
+
+      writeFileAtomic(filePath, 'new');
+
+      assert.strictEqual(fs.readFileSync(filePath, 'utf8'), 'new');
+      assert.deepStrictEqual(fs.readdirSync(tmpDir), ['data.json']);
+    });
+
+    it('should restrict permissions to the owner', function() {
+      if (process.platform === 'win32') {
+        this.skip();
+      }
+      const filePath = path.join(tmpDir, 'data.json');
+      fs.writeFileSync(filePath, 'old', { mode: 0o644 });
+
+      writeFileAtomic(filePath, 'new');
+
+      assert.strictEqual(fs.statSync(filePath).mode & 0o777, 0o600);
+    });
+  });
+});